@@ -36,6 +36,10 @@ def get_temperature(city: str) -> float:
     return temps.get(city, 70.0)
 
 
+# Same city -> same answer, so repeated calls can reuse the cached result
+get_temperature.pure = True
+
+
 def convert_temp(fahrenheit: float, to_unit: str) -> float:
     """Convert temperature from Fahrenheit to another unit.
 
@@ -43,10 +47,11 @@ def convert_temp(fahrenheit: float, to_unit: str) -> float:
         fahrenheit: Temperature in Fahrenheit
         to_unit: Target unit — 'celsius' or 'kelvin'
     """
+    celsius = (fahrenheit - 32) * 5 / 9
     if to_unit == "celsius":
-        return round((fahrenheit - 32) * 5 / 9, 1)
+        return round(celsius, 1)
     if to_unit == "kelvin":
-        return round((fahrenheit - 32) * 5 / 9 + 273.15, 1)
+        return round(celsius + 273.15, 1)
     return fahrenheit
 
 
@@ -58,13 +63,15 @@ def calculate(a: float, b: float, operation: str) -> float:
         b: Second number
         operation: One of add, subtract, multiply, divide
     """
-    ops = {
-        "add": lambda x, y: x + y,
-        "subtract": lambda x, y: x - y,
-        "multiply": lambda x, y: x * y,
-        "divide": lambda x, y: x / y if y != 0 else float("inf"),
-    }
-    return ops.get(operation, lambda x, y: 0)(a, b)
+    if operation == "add":
+        return a + b
+    if operation == "subtract":
+        return a - b
+    if operation == "multiply":
+        return a * b
+    if operation == "divide":
+        return a / b if b != 0 else float("inf")
+    return 0.0
 
 
 # -- Agent setup & run --------------------------------------------------------
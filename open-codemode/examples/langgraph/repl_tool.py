@@ -9,18 +9,40 @@ The server generates TypeScript signatures from the JSON schemas, which
 are included in the tool description so the LLM knows how to call them.
 """
 
+import asyncio
+import concurrent.futures
+import functools
 import json
 import inspect
+import itertools
 import logging
+import math
+import re
 import threading
-import uuid
+import types
+import typing
+from collections import defaultdict, deque
 from typing import Callable, Any
 
-import websocket
-from langchain_core.tools import tool
+from langchain_core.tools import BaseTool, StructuredTool
+from pydantic import BaseModel, Field
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib json module
+    orjson = None
 
 log = logging.getLogger("repl_tool")
 
+# Maximum number of queued messages coalesced into a single WebSocket frame.
+_SEND_BATCH_MAX = 128
+# Default number of tool_call handlers running concurrently.
+_TOOL_CALL_WORKERS = 8
+# Maximum number of memoized results for functions marked `pure`.
+_RESULT_CACHE_MAX = 256
+
 
 def configure_logging(level: int | str = logging.WARNING) -> None:
     """Configure repl_tool log level.
@@ -39,13 +61,78 @@ def configure_logging(level: int | str = logging.WARNING) -> None:
         logger.addHandler(handler)
 
 
+# -- Serialization -----------------------------------------------------------
+
+_NON_FINITE_MESSAGE = "Out of range float values are not JSON compliant"
+
+
+def _is_finite(obj: Any) -> bool:
+    """Return False if obj contains an inf/nan float anywhere."""
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(_is_finite(k) and _is_finite(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return all(_is_finite(v) for v in obj)
+    return True
+
+
+def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize a message to UTF-8 encoded JSON.
+
+    Always produces strict JSON: raises ValueError for inf/nan and TypeError
+    for unserializable values, so a bad message never reaches the wire
+    (where it would break the whole batched frame).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            data = orjson.dumps(obj, option=option)
+        except TypeError:
+            # e.g. ints wider than 64 bits; the stdlib handles these
+            pass
+        else:
+            # orjson silently writes inf/nan as null; only then is a walk needed
+            if b"null" in data and not _is_finite(obj):
+                raise ValueError(_NON_FINITE_MESSAGE)
+            return data
+    try:
+        return json.dumps(obj, sort_keys=sort_keys, allow_nan=False).encode()
+    except ValueError:
+        raise ValueError(_NON_FINITE_MESSAGE) from None
+
+
+def _tool_result_payload(call_id: Any, result_json: bytes) -> bytes:
+    """Wrap an already-serialized result in a tool_result envelope."""
+    return b'{"type":"tool_result","callId":' + _dumps(call_id) + b',"result":' + result_json + b"}"
+
+
+def _loads(data: str | bytes) -> Any:
+    """Parse a JSON message. Raises json.JSONDecodeError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# -- Result cache ------------------------------------------------------------
+
+def _result_cache_key(tool_name: str, args: Any) -> tuple[str, bytes]:
+    """
+    Build a cache key for a tool call from its canonically serialized args.
+
+    Serializing (rather than hashing the values) keeps True, 1 and 1.0 apart.
+    """
+    return tool_name, _dumps(args, sort_keys=True)
+
+
 # -- Validation --------------------------------------------------------------
 
 def _validate_function(func: Callable) -> None:
     """Reject LangGraph tools and other non-plain functions."""
-    if hasattr(func, "name") and hasattr(func, "description") and hasattr(func, "args_schema"):
+    if isinstance(func, BaseTool):
         raise TypeError(
-            f"'{func.__name__}' is a LangGraph tool. Pass the raw function instead, "
+            f"'{func.name}' is a LangGraph tool. Pass the raw function instead, "
             f"or use func.__wrapped__ to unwrap it."
         )
     if not callable(func):
@@ -53,6 +140,11 @@ def _validate_function(func: Callable) -> None:
 
 
 # -- JSON Schema generation from Python type hints ----------------------------
+#
+# Schemas are pure functions of the function object, so the per-function
+# builders below are memoized. Callers must treat the results as read-only.
+# The caches are bounded so per-request closures don't accumulate forever.
+_SCHEMA_CACHE_SIZE = 256
 
 _PYTHON_TYPE_TO_JSON: dict[type, str] = {
     str: "string",
@@ -63,25 +155,25 @@ _PYTHON_TYPE_TO_JSON: dict[type, str] = {
     dict: "object",
 }
 
+# typing.Union[X, Y] / Optional[X] and PEP 604 X | Y
+_UNION_TYPES = (typing.Union, types.UnionType)
+
 
 def _python_type_to_json_schema(annotation: Any) -> dict:
     """Convert a Python type annotation to a JSON Schema type descriptor."""
     if annotation is inspect.Parameter.empty or annotation is Any:
         return {}
 
-    # Handle Optional[X] / X | None
-    origin = getattr(annotation, "__origin__", None)
-    args = getattr(annotation, "__args__", ())
+    # Plain type (the common case) -- no generic introspection needed
+    json_type = _PYTHON_TYPE_TO_JSON.get(annotation)
+    if json_type:
+        return {"type": json_type}
 
-    if origin is type(int | str):  # UnionType (3.10+)
-        non_none = [a for a in args if a is not type(None)]
-        if len(non_none) == 1:
-            return _python_type_to_json_schema(non_none[0])
-        return {}
+    # Handle Optional[X] / X | None
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
 
-    # typing.Union
-    import typing
-    if origin is typing.Union:
+    if origin in _UNION_TYPES:
         non_none = [a for a in args if a is not type(None)]
         if len(non_none) == 1:
             return _python_type_to_json_schema(non_none[0])
@@ -99,21 +191,23 @@ def _python_type_to_json_schema(annotation: Any) -> dict:
     if origin is dict:
         return {"type": "object"}
 
-    # Plain type
-    json_type = _PYTHON_TYPE_TO_JSON.get(annotation)
-    if json_type:
-        return {"type": json_type}
-
     return {}
 
 
+@functools.lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
+def _signature(func: Callable) -> inspect.Signature:
+    """inspect.signature, computed once per function."""
+    return inspect.signature(func)
+
+
+@functools.lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
 def _func_to_json_schema(func: Callable) -> dict:
     """
     Generate a JSON Schema for a function's input parameters.
     
     Inspects type hints, defaults, and docstring to build the schema.
     """
-    sig = inspect.signature(func)
+    sig = _signature(func)
     properties: dict[str, dict] = {}
     required: list[str] = []
 
@@ -122,9 +216,10 @@ def _func_to_json_schema(func: Callable) -> dict:
 
     for name, param in sig.parameters.items():
         prop: dict = {}
+        annotation = param.annotation
 
         # Type
-        type_schema = _python_type_to_json_schema(param.annotation)
+        type_schema = _python_type_to_json_schema(annotation)
         prop.update(type_schema)
 
         # Description from docstring
@@ -138,10 +233,8 @@ def _func_to_json_schema(func: Callable) -> dict:
             required.append(name)
 
         # Enum from Literal type hint
-        origin = getattr(param.annotation, "__origin__", None)
-        import typing
-        if origin is typing.Literal:
-            prop["enum"] = list(param.annotation.__args__)
+        if typing.get_origin(annotation) is typing.Literal:
+            prop["enum"] = list(typing.get_args(annotation))
             prop["type"] = "string"
 
         properties[name] = prop
@@ -156,35 +249,37 @@ def _func_to_json_schema(func: Callable) -> dict:
     return schema
 
 
+# Indented block following an "Args:" / "Parameters:" header, up to the
+# next unindented line (blank lines inside the block are allowed)
+_ARGS_BLOCK_RE = re.compile(
+    r"^[ \t]*(?:Args|Parameters):[ \t]*\n((?:(?:[ \t]+.+|[ \t]*)\n?)+)",
+    re.MULTILINE | re.IGNORECASE,
+)
+# "name: description" or "name (type): description"
+_PARAM_LINE_RE = re.compile(
+    r"^[ \t]*(\w+)[ \t]*(?:\([^)]*\))?[ \t]*:[ \t]*(.+?)[ \t]*$",
+    re.MULTILINE,
+)
+
+
+@functools.lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
 def _parse_param_docs(func: Callable) -> dict[str, str]:
     """Extract parameter descriptions from a function's docstring."""
     doc = inspect.getdoc(func)
     if not doc:
         return {}
 
-    descriptions: dict[str, str] = {}
-    in_args = False
-
-    for line in doc.split("\n"):
-        stripped = line.strip()
-        if stripped.lower().startswith("args:") or stripped.lower().startswith("parameters:"):
-            in_args = True
-            continue
-        if stripped.lower().startswith("returns:") or stripped.lower().startswith("raises:"):
-            in_args = False
-            continue
-        if in_args and ":" in stripped:
-            parts = stripped.split(":", 1)
-            param_name = parts[0].strip()
-            param_desc = parts[1].strip()
-            descriptions[param_name] = param_desc
+    match = _ARGS_BLOCK_RE.search(doc)
+    if not match:
+        return {}
 
-    return descriptions
+    return dict(_PARAM_LINE_RE.findall(match.group(1)))
 
 
+@functools.lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
 def _return_type_to_json_schema(func: Callable) -> dict | None:
     """Generate JSON Schema for a function's return type."""
-    sig = inspect.signature(func)
+    sig = _signature(func)
     if sig.return_annotation is inspect.Parameter.empty:
         return None
     
@@ -198,10 +293,11 @@ def _return_type_to_json_schema(func: Callable) -> dict | None:
     return None
 
 
+@functools.lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
 def _func_to_tool_descriptor(func: Callable) -> dict:
     """Convert a Python function to a ClientToolDescriptor for WS registration."""
     doc = inspect.getdoc(func) or ""
-    first_line = doc.split("\n")[0].strip() if doc else func.__name__
+    first_line = doc.partition("\n")[0].strip() if doc else func.__name__
 
     descriptor = {
         "name": func.__name__,
@@ -225,47 +321,69 @@ class _WsBridge:
     
     Handles: connect, register tools, get signatures, execute code,
     and respond to tool_call messages from the server.
+
+    The connection runs on a private asyncio event loop in a background
+    thread. Loop-side state (waiters, outbox) is only touched from that
+    loop; the blocking public methods hand coroutines over to it.
     """
 
-    def __init__(self, ws_url: str, functions: list[Callable], timeout: int):
+    def __init__(
+        self,
+        ws_url: str,
+        functions: list[Callable],
+        timeout: int,
+        tool_workers: int = _TOOL_CALL_WORKERS,
+    ):
         self.ws_url = ws_url
         self.functions = {f.__name__: f for f in functions}
         self.timeout = timeout
         self.signatures: str | None = None
 
-        self._ws: websocket.WebSocketApp | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._thread: threading.Thread | None = None
-        self._connected = threading.Event()
-        self._pending: dict[str, tuple[threading.Event, dict]] = {}
-        self._response_events: dict[str, tuple[threading.Event, dict]] = {}
-        self._lock = threading.Lock()
+        self._ws: ClientConnection | None = None
+        self._reader: asyncio.Task | None = None
+        self._writer: asyncio.Task | None = None
+        self._outbox: asyncio.Queue[bytes] | None = None
+        self._tool_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=tool_workers, thread_name_prefix="tool-call"
+        )
+        self._pending: dict[str, asyncio.Future] = {}
+        # Execution ids only need to be unique per connection
+        self._exec_ids = itertools.count(1)
+        # Response type -> FIFO of futures from _send_and_wait
+        self._waiters_by_type: defaultdict[str, deque[asyncio.Future]] = defaultdict(deque)
         self._ready = False
-        self._error: str | None = None
+        # (tool name, serialized args) -> serialized result, for functions marked `pure`
+        self._result_cache: dict[tuple[str, bytes], bytes] = {}
+        self._result_cache_lock = threading.Lock()
+
+        # Message type -> handler; anything else is a _send_and_wait response
+        self._handlers: dict[str, Callable[[dict], None]] = {
+            "tool_call": self._handle_tool_call,
+            "execution_result": self._handle_execution_result,
+        }
 
     # -- Lifecycle ------------------------------------------------------------
 
     def start(self) -> None:
         """Connect, register tools, and fetch signatures."""
         log.info("Connecting to %s", self.ws_url)
-        self._ws = websocket.WebSocketApp(
-            self.ws_url,
-            on_open=self._on_open,
-            on_message=self._on_message,
-            on_error=self._on_error,
-            on_close=self._on_close,
-        )
-        self._thread = threading.Thread(target=self._ws.run_forever, daemon=True)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
         self._thread.start()
 
-        if not self._connected.wait(timeout=10):
-            raise ConnectionError(f"Failed to connect to {self.ws_url}")
-        if self._error:
-            raise ConnectionError(self._error)
+        try:
+            self._call(self._connect())
+        except Exception as e:
+            self.stop()
+            raise ConnectionError(f"Failed to connect to {self.ws_url}: {e}") from e
 
         # Register tools
         descriptors = [_func_to_tool_descriptor(f) for f in self.functions.values()]
         log.info("Registering %d tools", len(descriptors))
-        log.debug("Tool descriptors: %s", json.dumps(descriptors, indent=2))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Tool descriptors: %s", json.dumps(descriptors, indent=2))
         resp = self._send_and_wait("register_tools", {"tools": descriptors}, expect=["success", "error"])
         if resp.get("type") == "error":
             raise RuntimeError(f"Tool registration failed: {resp.get('message')}")
@@ -275,127 +393,212 @@ class _WsBridge:
         if resp.get("type") == "error":
             raise RuntimeError(f"Failed to get signatures: {resp.get('message')}")
         self.signatures = resp.get("content", "")
-        log.debug("Received signatures:\n%s", self.signatures)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Received signatures:\n%s", self.signatures)
         self._ready = True
 
     def stop(self) -> None:
-        """Close the WebSocket connection."""
+        """Close the WebSocket connection and stop the event loop."""
+        self._ready = False
+        self._tool_executor.shutdown(wait=False, cancel_futures=True)
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            self._call(self._close(), timeout=5)
+        except Exception as e:
+            log.warning("Error while closing WebSocket: %s", e)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        if not self._thread.is_alive():
+            # Closed loop marks the bridge as stopped; later calls are no-ops
+            self._loop.close()
+
+    async def _connect(self) -> None:
+        # No message size cap: signatures, execution output and tool args
+        # can legitimately exceed the library's 1 MiB default
+        self._ws = await connect(self.ws_url, open_timeout=10, max_size=None)
+        log.info("WebSocket connected")
+        self._outbox = asyncio.Queue()
+        self._reader = asyncio.create_task(self._read_loop())
+        self._writer = asyncio.create_task(self._write_loop())
+
+    async def _close(self) -> None:
+        if self._writer:
+            self._writer.cancel()
         if self._ws:
-            self._ws.close()
+            await self._ws.close()
 
     # -- Send / receive helpers -----------------------------------------------
 
+    def _call(self, coro: Any, timeout: float | None = None) -> Any:
+        """Run a coroutine on the bridge's event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
     def _send(self, msg: dict) -> None:
-        if self._ws and self._ws.sock and self._ws.sock.connected:
-            self._ws.send(json.dumps(msg))
+        """Queue a message for the writer task. Safe to call from any thread."""
+        try:
+            payload = _dumps(msg)
+        except (TypeError, ValueError):
+            log.exception("Dropping unserializable %s message", msg.get("type"))
+            return
+        self._send_raw(payload)
 
-    def _send_and_wait(self, msg_type: str, payload: dict, expect: list[str], timeout: float = 15) -> dict:
-        """Send a message and block until one of the expected response types arrives."""
-        wait_id = str(uuid.uuid4())
-        event = threading.Event()
-        container: dict[str, Any] = {}
+    def _send_raw(self, payload: bytes) -> None:
+        """
+        Queue an already-serialized message. Safe to call from any thread.
 
-        with self._lock:
-            self._response_events[wait_id] = (event, container)
+        The payload must come from _dumps (directly or via
+        _tool_result_payload); the writer batches it verbatim.
+        """
+        self._loop.call_soon_threadsafe(self._outbox.put_nowait, payload)
 
-        container["_expect"] = expect
+    async def _write_loop(self) -> None:
+        """
+        Drain the outbox, coalescing everything queued since the last write
+        into a single frame (a JSON array when more than one message).
+        """
+        while True:
+            batch = [await self._outbox.get()]
+            while len(batch) < _SEND_BATCH_MAX and not self._outbox.empty():
+                batch.append(self._outbox.get_nowait())
+
+            payload = batch[0] if len(batch) == 1 else b"[" + b",".join(batch) + b"]"
+            try:
+                await self._ws.send(payload, text=True)
+            except ConnectionClosed as e:
+                log.error("Failed to send %d message(s): %s", len(batch), e)
+            except Exception:
+                log.exception("Failed to send %d message(s)", len(batch))
 
-        self._send({"type": msg_type, **payload})
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                data = await self._ws.recv(decode=False)
+                # One bad frame must not take down the connection
+                try:
+                    self._on_message(data)
+                except Exception:
+                    log.exception("Error handling WebSocket message")
+        except ConnectionClosed as e:
+            log.info("WebSocket closed (code=%s)", e.rcvd.code if e.rcvd else None)
+        except Exception:
+            log.exception("WebSocket reader failed")
+        finally:
+            self._ready = False
+            self._fail_waiters(ConnectionError("WebSocket connection closed"))
+
+    def _fail_waiters(self, error: Exception) -> None:
+        """Fail every outstanding request so callers don't wait out their timeout."""
+        futures = list(self._pending.values())
+        for waiters in self._waiters_by_type.values():
+            futures.extend(waiters)
+        self._pending.clear()
+        self._waiters_by_type.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
 
-        if not event.wait(timeout=timeout):
-            with self._lock:
-                self._response_events.pop(wait_id, None)
-            raise TimeoutError(f"Timeout waiting for {expect} response")
+    def _send_and_wait(self, msg_type: str, payload: dict, expect: list[str], timeout: float = 15) -> dict:
+        """Send a message and block until one of the expected response types arrives."""
+        try:
+            return self._call(self._request({"type": msg_type, **payload}, expect, timeout))
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timeout waiting for {expect} response") from None
 
-        with self._lock:
-            self._response_events.pop(wait_id, None)
+    async def _request(self, msg: dict, expect: list[str], timeout: float) -> dict:
+        future = self._loop.create_future()
+        for response_type in expect:
+            self._waiters_by_type[response_type].append(future)
 
-        return container.get("_response", {})
+        try:
+            self._outbox.put_nowait(_dumps(msg))
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            # Drop the future from every queue it's still in (it was only
+            # popped from the one matching the response, if any)
+            for response_type in expect:
+                try:
+                    self._waiters_by_type[response_type].remove(future)
+                except ValueError:
+                    pass
 
     def execute(self, code: str) -> str:
         """Send execute_code and wait for execution_result."""
         if not self._ready:
             return "Error: WebSocket bridge not initialized"
 
-        exec_id = f"exec_{uuid.uuid4().hex[:12]}"
-        event = threading.Event()
-        result_container: dict[str, Any] = {}
-
-        with self._lock:
-            self._pending[exec_id] = (event, result_container)
-
+        exec_id = f"exec_{next(self._exec_ids)}"
         log.debug("execute_code [%s]: %s", exec_id, code)
-        self._send({
-            "type": "execute_code",
-            "executionId": exec_id,
-            "code": code,
-        })
-
-        if not event.wait(timeout=self.timeout):
-            with self._lock:
-                self._pending.pop(exec_id, None)
+
+        try:
+            resp = self._call(self._execute(exec_id, code))
+        except asyncio.TimeoutError:
             log.warning("Execution timed out [%s]", exec_id)
             return f"Execution timed out after {self.timeout} seconds"
-
-        with self._lock:
-            self._pending.pop(exec_id, None)
-
-        resp = result_container.get("_response", {})
+        except ConnectionError as e:
+            log.warning("execute_code [%s] failed: %s", exec_id, e)
+            return f"Execution failed: {e}"
 
         if resp.get("success"):
-            log.debug("execute_code [%s] succeeded: %s", exec_id, resp.get("output", "")[:200])
-            return resp.get("output", "")
+            output = resp.get("output", "")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("execute_code [%s] succeeded: %s", exec_id, output[:200])
+            return output
         log.warning("execute_code [%s] failed: %s", exec_id, resp.get("error", "Unknown error"))
         return f"Execution failed: {resp.get('error', 'Unknown error')}"
 
-    # -- WebSocket callbacks --------------------------------------------------
+    async def _execute(self, exec_id: str, code: str) -> dict:
+        future = self._loop.create_future()
+        self._pending[exec_id] = future
 
-    def _on_open(self, ws: Any) -> None:
-        log.info("WebSocket connected")
-        self._connected.set()
-
-    def _on_error(self, ws: Any, error: Any) -> None:
-        log.error("WebSocket error: %s", error)
-        self._error = str(error)
-        self._connected.set()
+        try:
+            self._outbox.put_nowait(_dumps({
+                "type": "execute_code",
+                "executionId": exec_id,
+                "code": code,
+            }))
+            return await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._pending.pop(exec_id, None)
 
-    def _on_close(self, ws: Any, close_status_code: Any, close_msg: Any) -> None:
-        log.info("WebSocket closed (code=%s)", close_status_code)
-        self._connected.clear()
-        self._ready = False
+    # -- Message handling (runs on the event loop) ----------------------------
 
-    def _on_message(self, ws: Any, data: str) -> None:
+    def _on_message(self, data: bytes) -> None:
         try:
-            msg = json.loads(data)
+            msg = _loads(data)
         except json.JSONDecodeError:
             return
 
-        msg_type = msg.get("type")
+        # A frame may carry a single message or a batch of them
+        if isinstance(msg, list):
+            for item in msg:
+                if isinstance(item, dict):
+                    self._dispatch(item)
+        elif isinstance(msg, dict):
+            self._dispatch(msg)
 
-        # Handle tool_call from server (bidirectional call-back)
-        if msg_type == "tool_call":
-            self._handle_tool_call(msg)
-            return
+    def _dispatch(self, msg: dict) -> None:
+        msg_type = msg.get("type")
 
-        # Handle execution_result
-        if msg_type == "execution_result":
-            exec_id = msg.get("executionId")
-            with self._lock:
-                entry = self._pending.get(exec_id)
-            if entry:
-                event, container = entry
-                container["_response"] = msg
-                event.set()
+        handler = self._handlers.get(msg_type)
+        if handler:
+            handler(msg)
             return
 
         # Handle expected response types (for _send_and_wait)
-        with self._lock:
-            for wait_id, (event, container) in list(self._response_events.items()):
-                expected = container.get("_expect", [])
-                if msg_type in expected:
-                    container["_response"] = msg
-                    event.set()
-                    break
+        waiters = self._waiters_by_type.get(msg_type)
+        while waiters:
+            future = waiters.popleft()
+            # Skip futures already answered through another type or timed out
+            if not future.done():
+                future.set_result(msg)
+                break
+
+    def _handle_execution_result(self, msg: dict) -> None:
+        """Resolve the execute() call waiting on this execution id."""
+        future = self._pending.pop(msg.get("executionId"), None)
+        if future and not future.done():
+            future.set_result(msg)
 
     def _handle_tool_call(self, msg: dict) -> None:
         """Execute a local Python function when the server calls back."""
@@ -413,17 +616,29 @@ class _WsBridge:
             })
             return
 
-        # Run in a thread to avoid blocking the WS message loop
+        cache_key = _result_cache_key(tool_name, args) if getattr(func, "pure", False) else None
+        if cache_key is not None:
+            with self._result_cache_lock:
+                result_json = self._result_cache.get(cache_key)
+            if result_json is not None:
+                log.info("tool_call %s(%s) [cached]", tool_name, args)
+                self._send_raw(_tool_result_payload(call_id, result_json))
+                return
+
+        # Run on the worker pool to avoid blocking the event loop
         def _run() -> None:
             try:
                 log.info("tool_call %s(%s)", tool_name, args)
                 result = func(**args) if isinstance(args, dict) else func(args)
                 log.debug("tool_call %s -> %s", tool_name, result)
-                self._send({
-                    "type": "tool_result",
-                    "callId": call_id,
-                    "result": result,
-                })
+                result_json = _dumps(result)
+                if cache_key is not None:
+                    with self._result_cache_lock:
+                        if len(self._result_cache) >= _RESULT_CACHE_MAX:
+                            # Evict the oldest entry
+                            del self._result_cache[next(iter(self._result_cache))]
+                        self._result_cache[cache_key] = result_json
+                self._send_raw(_tool_result_payload(call_id, result_json))
             except Exception as e:
                 log.error("tool_call %s raised: %s", tool_name, e)
                 self._send({
@@ -432,16 +647,23 @@ class _WsBridge:
                     "error": str(e),
                 })
 
-        threading.Thread(target=_run, daemon=True).start()
+        self._tool_executor.submit(_run)
 
 
 # -- Public API ---------------------------------------------------------------
 
+class _ExecuteCodeInput(BaseModel):
+    """Input schema for the generated code execution tool."""
+
+    code: str = Field(description="TypeScript/JavaScript code to execute")
+
+
 def create_repl_tool(
     functions: list[Callable],
     ws_url: str = "ws://localhost:9733",
     tool_name: str = "code_executor",
     timeout: int = 60,
+    tool_workers: int = _TOOL_CALL_WORKERS,
 ) -> Any:
     """
     Create a LangGraph tool backed by the open-codemode WebSocket server.
@@ -457,6 +679,8 @@ def create_repl_tool(
         ws_url:    WebSocket server URL (e.g. "ws://localhost:9733")
         tool_name: Name for the generated LangGraph tool
         timeout:   Execution timeout in seconds
+        tool_workers: Maximum number of functions running concurrently when
+                   executed code calls back into Python
 
     Returns:
         A LangGraph-compatible tool
@@ -477,7 +701,7 @@ def create_repl_tool(
     for func in functions:
         _validate_function(func)
 
-    bridge = _WsBridge(ws_url, functions, timeout)
+    bridge = _WsBridge(ws_url, functions, timeout, tool_workers)
     bridge.start()
 
     description = (
@@ -488,19 +712,15 @@ def create_repl_tool(
         "Use `console.log()` to produce output — only logged values appear "
         "in the result. Example: `console.log(await get_temperature('NYC'))`"
     )
-
-    @tool(tool_name)
-    def execute_code(code: str) -> str:
-        """Execute code with access to registered functions.
-
-        Args:
-            code: TypeScript/JavaScript code to execute
-        """
-        result = bridge.execute(code)
-        return result
-
-    execute_code.description = description
-    return execute_code
+    # The signatures now live only in the description
+    bridge.signatures = None
+
+    return StructuredTool.from_function(
+        func=bridge.execute,
+        name=tool_name,
+        description=description,
+        args_schema=_ExecuteCodeInput,
+    )
 
 
 def repl_tool(
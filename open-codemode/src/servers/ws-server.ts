@@ -44,8 +44,10 @@ export class WsServer {
 
     ws.onmessage = async (event) => {
       try {
-        const message: ClientMessage = JSON.parse(event.data as string)
-        await this.handleMessage(ws, connectionId, message)
+        const parsed: ClientMessage | ClientMessage[] = JSON.parse(event.data as string)
+        // Clients may coalesce several messages into a single frame
+        const messages = Array.isArray(parsed) ? parsed : [parsed]
+        await Promise.all(messages.map((message) => this.handleMessage(ws, connectionId, message)))
       } catch (error) {
         console.error(`[WS] Error handling message:`, error)
         this.sendError(ws, `Invalid message format: ${error instanceof Error ? error.message : String(error)}`)